@@ -7,9 +7,15 @@ Generates personalized cold emails using prospect research.
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
 import json
 import os
+import re
+import string
 import sys
+import time
 from dataclasses import dataclass, asdict
 from typing import Optional
 
@@ -20,6 +26,79 @@ except ImportError:
     print("Install: pip install requests beautifulsoup4")
     sys.exit(1)
 
+# lxml is ~10x faster than html.parser; fall back if it's not installed
+try:
+    import lxml.html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Optional on-disk HTTP cache so repeat research doesn't re-hit target sites
+try:
+    import requests_cache
+    HAS_REQUESTS_CACHE = True
+except ImportError:
+    HAS_REQUESTS_CACHE = False
+
+# orjson serializes dataclasses directly and much faster than stdlib json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# diskcache backs the optional LLM response cache
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+# httpx is only needed for --batch mode
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+CACHE_DIR = os.path.expanduser('~/.cache/cold_email')
+USER_AGENT = 'Mozilla/5.0 (compatible; EmailResearch/1.0)'
+
+# Read at most this much of a page; the extraction only needs the top
+MAX_BODY_BYTES = 512 * 1024
+# (connect, read) timeouts in seconds
+FETCH_TIMEOUT = (3, 7)
+
+# Tech indicators in script URLs, matched in one compiled-regex pass
+TECH_PATTERNS = {
+    'react': 'React',
+    'vue': 'Vue',
+    'angular': 'Angular',
+    'stripe': 'Stripe',
+    'intercom': 'Intercom',
+    'hubspot': 'HubSpot',
+}
+TECH_RE = re.compile('|'.join(map(re.escape, TECH_PATTERNS)))
+
+# Bound every LLM call: stuck requests can't hang forever and runaway
+# generations can't inflate cost
+LLM_TIMEOUT = 20
+LLM_MAX_RETRIES = 3
+# Extra attempts generate_async makes after the SDK's own retries are
+# exhausted by sustained throttling
+RATE_LIMIT_MAX_RETRIES = 5
+MAX_OUTPUT_TOKENS = {'short': 768, 'medium': 1200}
+PROMPT_TOKEN_CAP = 2000
+
+LLM_MODELS = {'openai': 'gpt-4o-mini', 'anthropic': 'claude-3-haiku-20240307'}
+LLM_CACHE_TTL = 7 * 86400
+
+# Conservative defaults per provider: requests/min, tokens/min, in-flight cap
+RATE_LIMIT_PROFILES = {
+    'openai': {'rpm': 60, 'tpm': 150_000, 'max_concurrency': 10},
+    'anthropic': {'rpm': 50, 'tpm': 80_000, 'max_concurrency': 10},
+}
+
 # Try AI providers
 try:
     import openai
@@ -33,6 +112,19 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+# tiktoken is optional; we fall back to a chars/4 estimate without it
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+RATE_LIMIT_ERRORS = ()
+if HAS_OPENAI:
+    RATE_LIMIT_ERRORS += (openai.RateLimitError,)
+if HAS_ANTHROPIC:
+    RATE_LIMIT_ERRORS += (anthropic.RateLimitError,)
+
 
 @dataclass
 class Prospect:
@@ -65,64 +157,242 @@ class ProspectResearcher:
     """Research prospects from public information."""
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; EmailResearch/1.0)'
-    
+        self.session = self._make_session()
+        self.session.headers['User-Agent'] = USER_AGENT
+
+    @staticmethod
+    def _make_session() -> requests.Session:
+        """Build a cached session, falling back to a plain one."""
+        if HAS_REQUESTS_CACHE:
+            try:
+                return requests_cache.CachedSession(
+                    os.path.join(CACHE_DIR, 'http'),
+                    backend='sqlite',
+                    expire_after=86400,
+                    allowable_codes=(200,)
+                )
+            except Exception:
+                pass  # cache dir unwritable etc. -- research still works
+        return requests.Session()
+
+    @functools.lru_cache(maxsize=256)
     def research_website(self, url: str) -> dict:
         """Extract info from company website."""
         try:
-            resp = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            
-            # Get description
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            description = meta_desc['content'] if meta_desc else None
-            
-            # Get title
-            title = soup.title.text if soup.title else None
-            
-            # Look for about text
-            about = None
-            for selector in ['#about', '.about', '[class*="about"]', 'section']:
-                elem = soup.select_one(selector)
-                if elem:
-                    text = elem.get_text()[:500]
-                    if len(text) > 100:
-                        about = text
+            resp = self.session.get(url, timeout=FETCH_TIMEOUT, stream=True)
+            body = resp.raw.read(MAX_BODY_BYTES, decode_content=True)
+            return self._parse_page(body)
+        except Exception as e:
+            return {'error': str(e)}
+
+    async def research_website_async(self, client: 'httpx.AsyncClient', url: str) -> dict:
+        """Async variant of research_website sharing one httpx client."""
+        try:
+            chunks, size = [], 0
+            async with client.stream('GET', url) as resp:
+                async for chunk in resp.aiter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= MAX_BODY_BYTES:
                         break
-            
-            # Look for tech indicators
-            tech_hints = []
-            scripts = soup.find_all('script', src=True)
-            for s in scripts:
-                src = s['src'].lower()
-                if 'react' in src: tech_hints.append('React')
-                if 'vue' in src: tech_hints.append('Vue')
-                if 'angular' in src: tech_hints.append('Angular')
-                if 'stripe' in src: tech_hints.append('Stripe')
-                if 'intercom' in src: tech_hints.append('Intercom')
-                if 'hubspot' in src: tech_hints.append('HubSpot')
-            
-            return {
-                'description': description,
-                'title': title,
-                'about': about,
-                'tech_hints': list(set(tech_hints))
-            }
+            return self._parse_page(b''.join(chunks))
         except Exception as e:
             return {'error': str(e)}
+
+    @staticmethod
+    def _parse_page(body: bytes) -> dict:
+        """Extract description/title/about/tech hints from raw HTML."""
+        if HTML_PARSER == 'lxml':
+            return ProspectResearcher._parse_page_lxml(body)
+        return ProspectResearcher._parse_page_soup(body)
+
+    @staticmethod
+    def _parse_page_lxml(body: bytes) -> dict:
+        """lxml XPath extraction: each query is one C call, no per-node
+        BeautifulSoup wrapper objects on the hot paths."""
+        tree = lxml.html.fromstring(body)
+
+        meta = tree.xpath('//meta[@name="description"]/@content')
+        description = meta[0] if meta else None
+
+        title = tree.findtext('.//title')
+
+        about = None
+        for xpath in ('//*[@id="about"]',
+                      '//*[contains(@class, "about")]',
+                      '//section'):
+            nodes = tree.xpath(xpath)
+            if nodes:
+                text = nodes[0].text_content()[:500]
+                if len(text) > 100:
+                    about = text
+                    break
+
+        # //script/@src returns plain strings in one call
+        blob = '\n'.join(src.lower() for src in tree.xpath('//script/@src'))
+        tech_hints = {TECH_PATTERNS[m] for m in TECH_RE.findall(blob)}
+
+        return {
+            'description': description,
+            'title': title,
+            'about': about,
+            'tech_hints': sorted(tech_hints)
+        }
+
+    @staticmethod
+    def _parse_page_soup(body: bytes) -> dict:
+        """BeautifulSoup fallback used when lxml isn't installed."""
+        soup = BeautifulSoup(body, HTML_PARSER)
+
+        # Get description
+        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        description = meta_desc['content'] if meta_desc else None
+
+        # Get title
+        title = soup.title.text if soup.title else None
+
+        # Look for about text (single traversal instead of one scan per selector)
+        about = None
+        for elem in (soup.find(id='about'),
+                     soup.find(class_=re.compile('about')),
+                     soup.find('section')):
+            if elem:
+                text = elem.get_text()[:500]
+                if len(text) > 100:
+                    about = text
+                    break
+
+        # Look for tech indicators: one regex scan over all script srcs
+        blob = '\n'.join(s['src'].lower() for s in soup.find_all('script', src=True))
+        tech_hints = {TECH_PATTERNS[m] for m in TECH_RE.findall(blob)}
+
+        return {
+            'description': description,
+            'title': title,
+            'about': about,
+            'tech_hints': sorted(tech_hints)
+        }
     
     def research(self, prospect: Prospect) -> Prospect:
         """Enrich prospect with research."""
         if prospect.website:
-            data = self.research_website(prospect.website)
-            if data.get('description'):
-                prospect.company_description = data['description']
-            if data.get('tech_hints'):
-                prospect.tech_stack = ', '.join(data['tech_hints'])
-        
+            self._enrich(prospect, self.research_website(prospect.website))
+        return prospect
+
+    async def research_async(self, client: 'httpx.AsyncClient', prospect: Prospect) -> Prospect:
+        """Async variant of research for batch mode."""
+        if prospect.website:
+            self._enrich(prospect, await self.research_website_async(client, prospect.website))
         return prospect
 
+    @staticmethod
+    def _enrich(prospect: Prospect, data: dict) -> None:
+        if data.get('description'):
+            prospect.company_description = data['description']
+        if data.get('tech_hints'):
+            prospect.tech_stack = ', '.join(data['tech_hints'])
+
+
+@functools.lru_cache(maxsize=None)
+def get_llm_cache():
+    """On-disk LLM response cache; None when unavailable."""
+    if HAS_DISKCACHE:
+        try:
+            return diskcache.Cache(os.path.join(CACHE_DIR, 'llm'))
+        except Exception:
+            pass  # cache dir unwritable etc. -- generation still works
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_llm_client(provider: str, use_async: bool = False):
+    """One shared SDK client per provider (and sync/async flavor).
+
+    Each construction builds an httpx client and TLS context; sharing one
+    keeps connections alive across calls in a batch.
+    """
+    if provider == 'openai':
+        cls = openai.AsyncOpenAI if use_async else openai.OpenAI
+    else:
+        cls = anthropic.AsyncAnthropic if use_async else anthropic.Anthropic
+    return cls(timeout=LLM_TIMEOUT, max_retries=LLM_MAX_RETRIES)
+
+
+class RateLimiter:
+    """Token-bucket limiter with AIMD concurrency control for LLM calls.
+
+    Holds two buckets (requests and tokens) refilled continuously from
+    the provider profile, plus an in-flight cap that shrinks by half on
+    a 429 and grows by one on each success, so batch throughput settles
+    just under the provider's ceiling instead of oscillating.
+    """
+
+    def __init__(self, provider: str):
+        profile = RATE_LIMIT_PROFILES[provider]
+        self.requests_per_sec = profile['rpm'] / 60
+        self.tokens_per_sec = profile['tpm'] / 60
+        self.max_concurrency = profile['max_concurrency']
+        self.concurrency = profile['max_concurrency']
+        self._request_bucket = float(profile['rpm'])
+        self._token_bucket = float(profile['tpm'])
+        self._request_cap = float(profile['rpm'])
+        self._token_cap = float(profile['tpm'])
+        self._in_flight = 0
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_bucket = min(self._request_cap,
+                                   self._request_bucket + elapsed * self.requests_per_sec)
+        self._token_bucket = min(self._token_cap,
+                                 self._token_bucket + elapsed * self.tokens_per_sec)
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Block until a request slot and token budget are available."""
+        while True:
+            async with self._lock:
+                self._refill()
+                if (self._in_flight < self.concurrency
+                        and self._request_bucket >= 1
+                        and self._token_bucket >= estimated_tokens):
+                    self._request_bucket -= 1
+                    self._token_bucket -= estimated_tokens
+                    self._in_flight += 1
+                    return
+                # Wait long enough for the scarcer bucket to refill
+                wait = max(
+                    (1 - self._request_bucket) / self.requests_per_sec,
+                    (estimated_tokens - self._token_bucket) / self.tokens_per_sec,
+                    0.05
+                )
+            await asyncio.sleep(min(wait, 5))
+
+    def release(self, success: Optional[bool] = True) -> None:
+        """Report call completion; adjusts concurrency AIMD-style.
+
+        success=True grows the in-flight cap by one, success=False halves
+        it (a 429), and success=None leaves it alone (a non-throttle
+        failure says nothing about the provider's ceiling).
+        """
+        self._in_flight = max(0, self._in_flight - 1)
+        if success is None:
+            return
+        if success:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+        else:
+            self.concurrency = max(1, self.concurrency // 2)
+
+    @staticmethod
+    def retry_after(exc: Exception) -> float:
+        """Pull Retry-After from an SDK rate-limit error, default 2s."""
+        try:
+            return float(exc.response.headers['retry-after'])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return 2.0
+
 
 class ColdEmailGenerator:
     """Generate personalized cold emails."""
@@ -130,21 +400,21 @@ class ColdEmailGenerator:
     TEMPLATE_PROMPT = """Generate a cold email with these requirements:
 
 PROSPECT:
-- Name: {name}
-- Company: {company}
-- Role: {role}
-- Company Description: {company_description}
-- Tech Stack: {tech_stack}
+- Name: $name
+- Company: $company
+- Role: $role
+- Company Description: $company_description
+- Tech Stack: $tech_stack
 
 SENDER:
-- Name: {sender_name}
-- Company: {sender_company}
-- Value Proposition: {value_prop}
-- Desired CTA: {cta}
+- Name: $sender_name
+- Company: $sender_company
+- Value Proposition: $value_prop
+- Desired CTA: $cta
 
 STYLE:
-- Tone: {tone}
-- Length: {length} (short=3-4 sentences, medium=5-6 sentences)
+- Tone: $tone
+- Length: $length (short=3-4 sentences, medium=5-6 sentences)
 
 RULES:
 1. Personalize based on prospect's company/role
@@ -155,14 +425,20 @@ RULES:
 6. Subject line should create curiosity
 
 Return JSON:
-{{
+{
     "subject": "Email subject line",
     "body": "Full email body",
     "follow_up": "Follow-up email if no response (shorter)"
-}}"""
+}"""
+
+    # Parsed once at class definition instead of re-parsing the format
+    # string on every generate() call
+    _TEMPLATE = string.Template(TEMPLATE_PROMPT)
 
-    def __init__(self, provider: str = 'auto'):
+    def __init__(self, provider: str = 'auto', use_cache: bool = True):
         self.provider = self._select_provider(provider)
+        self._limiter = RateLimiter(self.provider)
+        self._cache = get_llm_cache() if use_cache else None
     
     def _select_provider(self, preferred: str) -> str:
         if preferred == 'openai' or (preferred == 'auto' and HAS_OPENAI and os.getenv('OPENAI_API_KEY')):
@@ -173,12 +449,80 @@ Return JSON:
     
     def generate(self, prospect: Prospect, config: EmailConfig) -> dict:
         """Generate a personalized cold email."""
-        prompt = self.TEMPLATE_PROMPT.format(
+        prompt = self._build_prompt(prospect, config)
+        max_tokens = MAX_OUTPUT_TOKENS[config.length]
+
+        key = self._cache_key(prompt)
+        if self._cache is not None and key in self._cache:
+            return self._cache[key]
+
+        if self.provider == 'openai':
+            result = self._generate_openai(prompt, max_tokens)
+        else:
+            result = self._generate_anthropic(prompt, max_tokens)
+
+        if self._cache is not None:
+            self._cache.set(key, result, expire=LLM_CACHE_TTL)
+        return result
+
+    async def generate_async(self, prospect: Prospect, config: EmailConfig) -> dict:
+        """Async variant of generate for batch mode (rate-limited)."""
+        prompt = self._build_prompt(prospect, config)
+        max_tokens = MAX_OUTPUT_TOKENS[config.length]
+        estimated_tokens = self._count_tokens(prompt) + max_tokens
+
+        key = self._cache_key(prompt)
+        if self._cache is not None and key in self._cache:
+            return self._cache[key]
+
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await self._limiter.acquire(estimated_tokens)
+            try:
+                if self.provider == 'openai':
+                    result = await self._generate_openai_async(prompt, max_tokens)
+                else:
+                    result = await self._generate_anthropic_async(prompt, max_tokens)
+            except RATE_LIMIT_ERRORS as e:
+                self._limiter.release(success=False)
+                if attempt == RATE_LIMIT_MAX_RETRIES:
+                    # Persistently throttled (quota exhausted?); let the
+                    # batch surface this per prospect instead of spinning
+                    raise
+                await asyncio.sleep(self._limiter.retry_after(e))
+            except Exception:
+                self._limiter.release(success=None)
+                raise
+            else:
+                self._limiter.release(success=True)
+                if self._cache is not None:
+                    self._cache.set(key, result, expire=LLM_CACHE_TTL)
+                return result
+
+    def _build_prompt(self, prospect: Prospect, config: EmailConfig) -> str:
+        company_description = prospect.company_description or 'Unknown'
+        tech_stack = prospect.tech_stack or 'Unknown'
+        prompt = self._render_prompt(prospect, config, company_description, tech_stack)
+
+        # Keep the prompt under a soft token cap by trimming the only
+        # unbounded fields (the research text); everything else is fixed-size
+        if self._count_tokens(prompt) > PROMPT_TOKEN_CAP:
+            prompt = self._render_prompt(prospect, config,
+                                         company_description[:500], tech_stack[:200])
+        return prompt
+
+    def _cache_key(self, prompt: str) -> str:
+        model = LLM_MODELS[self.provider]
+        return hashlib.blake2b(f'{self.provider}|{model}|{prompt}'.encode(),
+                               digest_size=16).hexdigest()
+
+    def _render_prompt(self, prospect: Prospect, config: EmailConfig,
+                       company_description: str, tech_stack: str) -> str:
+        return self._TEMPLATE.substitute(
             name=prospect.name,
             company=prospect.company,
             role=prospect.role or 'Unknown',
-            company_description=prospect.company_description or 'Unknown',
-            tech_stack=prospect.tech_stack or 'Unknown',
+            company_description=company_description,
+            tech_stack=tech_stack,
             sender_name=config.sender_name,
             sender_company=config.sender_company,
             value_prop=config.value_prop,
@@ -186,34 +530,120 @@ Return JSON:
             tone=config.tone,
             length=config.length
         )
-        
-        if self.provider == 'openai':
-            return self._generate_openai(prompt)
-        else:
-            return self._generate_anthropic(prompt)
-    
-    def _generate_openai(self, prompt: str) -> dict:
-        client = openai.OpenAI()
+
+    @staticmethod
+    def _count_tokens(text: str) -> int:
+        """Count prompt tokens, estimating ~4 chars/token without tiktoken."""
+        if HAS_TIKTOKEN:
+            try:
+                return len(tiktoken.encoding_for_model('gpt-4o-mini').encode(text))
+            except Exception:
+                pass  # unknown model / no cached BPE data
+        return len(text) // 4
+
+    def _generate_openai(self, prompt: str, max_tokens: int) -> dict:
+        client = get_llm_client('openai')
         response = client.chat.completions.create(
-            model='gpt-4o-mini',
+            model=LLM_MODELS['openai'],
             messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"}
+            response_format={"type": "json_object"},
+            max_tokens=max_tokens
         )
         return json.loads(response.choices[0].message.content)
-    
-    def _generate_anthropic(self, prompt: str) -> dict:
-        client = anthropic.Anthropic()
+
+    async def _generate_openai_async(self, prompt: str, max_tokens: int) -> dict:
+        client = get_llm_client('openai', use_async=True)
+        response = await client.chat.completions.create(
+            model=LLM_MODELS['openai'],
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            max_tokens=max_tokens
+        )
+        return json.loads(response.choices[0].message.content)
+
+    def _generate_anthropic(self, prompt: str, max_tokens: int) -> dict:
+        client = get_llm_client('anthropic')
         response = client.messages.create(
-            model='claude-3-haiku-20240307',
-            max_tokens=2048,
+            model=LLM_MODELS['anthropic'],
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt + "\n\nRespond with JSON only."}]
+        )
+        return self._parse_anthropic(response)
+
+    async def _generate_anthropic_async(self, prompt: str, max_tokens: int) -> dict:
+        client = get_llm_client('anthropic', use_async=True)
+        response = await client.messages.create(
+            model=LLM_MODELS['anthropic'],
+            max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt + "\n\nRespond with JSON only."}]
         )
+        return self._parse_anthropic(response)
+
+    @staticmethod
+    def _parse_anthropic(response) -> dict:
         content = response.content[0].text
         if '```' in content:
             content = content.split('```')[1].replace('json', '').strip()
         return json.loads(content)
 
 
+def load_prospects(path: str) -> list:
+    """Read prospects from a JSONL file (one prospect object per line)."""
+    prospects = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                prospects.append(Prospect(**json.loads(line)))
+    return prospects
+
+
+async def run_batch(prospects: list, config: EmailConfig, provider: str,
+                    concurrency: int = 10, research: bool = True,
+                    use_cache: bool = True) -> list:
+    """Research and generate for many prospects concurrently.
+
+    Returns a list of (prospect, email_or_exception) in input order.
+    """
+    researcher = ProspectResearcher()
+    generator = ColdEmailGenerator(provider, use_cache=use_cache)
+    sem = asyncio.Semaphore(concurrency)
+
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=20),
+        timeout=10,
+        follow_redirects=True,
+        headers={'User-Agent': USER_AGENT}
+    ) as client:
+        async def pipeline(prospect: Prospect):
+            async with sem:
+                if research and prospect.website:
+                    prospect = await researcher.research_async(client, prospect)
+                return await generator.generate_async(prospect, config)
+
+        emails = await asyncio.gather(*(pipeline(p) for p in prospects),
+                                      return_exceptions=True)
+
+    return list(zip(prospects, emails))
+
+
+def print_json(result, indent: bool = False) -> None:
+    """Write result as JSON to stdout, via orjson when available.
+
+    orjson walks Prospect dataclasses directly, so callers can pass them
+    without an asdict() copy per prospect.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        sys.stdout.buffer.write(orjson.dumps(result, option=option))
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(result, indent=2 if indent else None, default=asdict))
+
+
 def format_email(email: dict, prospect: Prospect) -> str:
     """Format email for display."""
     output = []
@@ -239,11 +669,17 @@ def main():
     )
     
     # Prospect args
-    parser.add_argument('--name', required=True, help='Prospect name')
-    parser.add_argument('--company', required=True, help='Company name')
+    parser.add_argument('--name', help='Prospect name')
+    parser.add_argument('--company', help='Company name')
     parser.add_argument('--role', help='Prospect role/title')
     parser.add_argument('--email', help='Prospect email')
     parser.add_argument('--website', help='Company website (for research)')
+
+    # Batch mode
+    parser.add_argument('--batch', metavar='FILE',
+                        help='JSONL file of prospects; process them concurrently')
+    parser.add_argument('--concurrency', type=int, default=10,
+                        help='Max concurrent prospects in batch mode')
     
     # Sender args
     parser.add_argument('--sender', required=True, help='Your name')
@@ -259,10 +695,52 @@ def main():
     # Output
     parser.add_argument('--json', action='store_true', help='Output raw JSON')
     parser.add_argument('--no-research', action='store_true', help='Skip website research')
+    parser.add_argument('--no-cache', action='store_true', help='Skip the LLM response cache')
     parser.add_argument('--provider', choices=['auto', 'openai', 'anthropic'], default='auto')
     
     args = parser.parse_args()
-    
+
+    if not args.batch and not (args.name and args.company):
+        parser.error('--name and --company are required (or use --batch)')
+
+    # Build config
+    config = EmailConfig(
+        sender_name=args.sender,
+        sender_company=args.sender_company,
+        value_prop=args.value_prop,
+        cta=args.cta,
+        tone=args.tone,
+        length=args.length
+    )
+
+    # Batch mode: fan out research + generation concurrently
+    if args.batch:
+        if not HAS_HTTPX:
+            print("Install: pip install httpx", file=sys.stderr)
+            sys.exit(1)
+        try:
+            prospects = load_prospects(args.batch)
+            print(f"Processing {len(prospects)} prospects...", file=sys.stderr)
+            results = asyncio.run(run_batch(
+                prospects, config, args.provider,
+                concurrency=args.concurrency,
+                research=not args.no_research,
+                use_cache=not args.no_cache
+            ))
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        failed = 0
+        for prospect, email in results:
+            if isinstance(email, Exception):
+                print(f"Error ({prospect.name}): {email}", file=sys.stderr)
+                failed += 1
+            elif args.json:
+                print_json({'prospect': prospect, 'email': email})
+            else:
+                print(format_email(email, prospect))
+        sys.exit(1 if results and failed == len(results) else 0)
+
     # Build prospect
     prospect = Prospect(
         name=args.name,
@@ -279,20 +757,10 @@ def main():
         prospect = researcher.research(prospect)
         if prospect.company_description:
             print(f"  Found: {prospect.company_description[:80]}...", file=sys.stderr)
-    
-    # Build config
-    config = EmailConfig(
-        sender_name=args.sender,
-        sender_company=args.sender_company,
-        value_prop=args.value_prop,
-        cta=args.cta,
-        tone=args.tone,
-        length=args.length
-    )
-    
+
     # Generate
     try:
-        generator = ColdEmailGenerator(args.provider)
+        generator = ColdEmailGenerator(args.provider, use_cache=not args.no_cache)
         print(f"Generating with {generator.provider}...", file=sys.stderr)
         email = generator.generate(prospect, config)
     except Exception as e:
@@ -301,8 +769,7 @@ def main():
     
     # Output
     if args.json:
-        result = {'prospect': asdict(prospect), 'email': email}
-        print(json.dumps(result, indent=2))
+        print_json({'prospect': prospect, 'email': email}, indent=True)
     else:
         print(format_email(email, prospect))
 